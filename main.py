@@ -4,13 +4,244 @@ Bybit Crypto Volume Scanner
 Monitors all crypto pairs on Bybit for volume spikes and sends alerts when thresholds are exceeded.
 """
 
-import json
+import argparse
+import asyncio
+import math
+import struct
+import sys
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import BinaryIO, Dict, Iterable, List, Tuple, Optional
+import aiohttp
+import numpy as np
+import orjson
+import zstandard as zstd
 from pybit.unified_trading import HTTP
 
+# Public REST endpoint used for concurrent kline requests
+BYBIT_API_URL = "https://api.bybit.com"
+
+# Pairs whose 24h volume is below this are considered negligible and skipped
+MIN_VOLUME = 0.01
+
+# Maximum number of kline requests in flight at once
+KLINE_CONCURRENCY = 8
+
+# Buffer size for volume history file I/O
+IO_BUFFER_SIZE = 64 * 1024
+
+# Snapshot compression; files without the zstd magic number are read as plain JSON
+ZSTD_LEVEL = 3
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# The full snapshot is rewritten (and the journal truncated) every this many scans
+JOURNAL_COMPACT_EVERY = 12
+
+# Stale records (older than the history window) are dropped every this many scans
+PRUNE_EVERY_SCANS = 12
+
+# Journal entries: a symbol definition (followed by the UTF-8 name) or a volume sample
+JOURNAL_TAG_SYMBOL = 0
+JOURNAL_TAG_SAMPLE = 1
+JOURNAL_SYMBOL = struct.Struct('<BIH')   # tag, symbol id, name length
+JOURNAL_SAMPLE = struct.Struct('<BIdQ')  # tag, symbol id, volume, timestamp ms
+
+# Console layout of a volume spike alert; numeric fields are pre-formatted by send_alert
+ALERT_TEMPLATE = (
+    "\n" + "=" * 80 + "\n"
+    "🚨 VOLUME SPIKE ALERT 🚨\n"
+    + "=" * 80 + "\n"
+    "Symbol:           {symbol}\n"
+    "Current Volume:   {current_volume}\n"
+    "Average Volume:   {avg_volume}\n"
+    "Volume Increase:  {volume_change_pct}%\n"
+    "Current Price:    {last_price}\n"
+    "Price Change 24h: {price_change_24h}\n"
+    "Time:             {timestamp}\n"
+    + "=" * 80 + "\n\n"
+)
+
+# Milliseconds per second, for epoch timestamp conversions
+MS_PER_SECOND = 1000
+
+# Seconds before the next scan at which its tickers snapshot is prefetched
+PREFETCH_LEAD_SECONDS = 5
+
+# Prefetched snapshots older than this are discarded in favour of a fresh fetch
+PREFETCH_MAX_AGE_SECONDS = 30
+
+
+class VolumeSeries:
+    """
+    Volume history of a single symbol, stored as parallel columns.
+    Samples are appended to bounded deques, so the oldest sample is evicted
+    automatically once the series is full, and converted to NumPy arrays lazily,
+    so repeated reads between two appends reuse the same arrays.
+    """
+    
+    def __init__(self, timestamps: Iterable[int] = (), volumes: Iterable[float] = (),
+                 maxlen: Optional[int] = None):
+        """
+        Initialize a volume series.
+        
+        Args:
+            timestamps: Sample times in milliseconds since the epoch, oldest first
+            volumes: 24h volume recorded at each sample time
+            maxlen: Maximum number of samples kept (None for unbounded)
+        """
+        self._timestamps: deque = deque(timestamps, maxlen=maxlen)
+        self._volumes: deque = deque(volumes, maxlen=maxlen)
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # Running sum of volumes, maintained on append, eviction and prune
+        self._total = sum(self._volumes)
+    
+    @classmethod
+    def from_dict(cls, data: Dict, maxlen: Optional[int] = None) -> 'VolumeSeries':
+        """
+        Build a series from its serialized form.
+        
+        Args:
+            data: Dictionary with 'timestamps' and 'volumes' lists
+            maxlen: Maximum number of samples kept (None for unbounded)
+            
+        Returns:
+            Volume series holding the given samples
+        """
+        return cls(data['timestamps'], data['volumes'], maxlen)
+    
+    @classmethod
+    def from_records(cls, records: List[Dict], maxlen: Optional[int] = None) -> 'VolumeSeries':
+        """
+        Build a series from legacy [{'timestamp': iso, 'volume': float}, ...] records.
+        
+        Args:
+            records: List of timestamped volume records
+            maxlen: Maximum number of samples kept (None for unbounded)
+            
+        Returns:
+            Volume series holding the given samples
+        """
+        timestamps = [
+            int(datetime.fromisoformat(record['timestamp']).timestamp() * MS_PER_SECOND)
+            for record in records
+        ]
+        return cls(timestamps, [record['volume'] for record in records], maxlen)
+    
+    def __len__(self) -> int:
+        return len(self._volumes)
+    
+    @property
+    def maxlen(self) -> Optional[int]:
+        """Maximum number of samples kept."""
+        return self._volumes.maxlen
+    
+    def resize(self, maxlen: Optional[int]):
+        """
+        Change the maximum number of samples, dropping the oldest ones if needed.
+        
+        Args:
+            maxlen: Maximum number of samples kept (None for unbounded)
+        """
+        if maxlen == self.maxlen:
+            return
+        self._timestamps = deque(self._timestamps, maxlen=maxlen)
+        self._volumes = deque(self._volumes, maxlen=maxlen)
+        self._total = sum(self._volumes)
+        self._arrays = None
+    
+    def _as_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (
+                np.fromiter(self._timestamps, dtype=np.int64, count=len(self._timestamps)),
+                np.fromiter(self._volumes, dtype=np.float64, count=len(self._volumes))
+            )
+        return self._arrays
+    
+    def append(self, timestamp_ms: int, volume: float):
+        """
+        Add a new sample, evicting the oldest one if the series is full.
+        
+        Args:
+            timestamp_ms: Sample time in milliseconds since the epoch
+            volume: Current 24h volume
+        """
+        if len(self._volumes) == self._volumes.maxlen:
+            self._total -= self._volumes[0]
+        self._timestamps.append(timestamp_ms)
+        self._volumes.append(volume)
+        self._total += volume
+        self._arrays = None
+    
+    def prune(self, cutoff_ms: int):
+        """
+        Drop samples recorded at or before the cutoff.
+        
+        Args:
+            cutoff_ms: Cutoff time in milliseconds since the epoch
+        """
+        if not self._timestamps or self._timestamps[0] > cutoff_ms:
+            return
+        
+        timestamps, volumes = self._as_arrays()
+        # Samples are appended in time order, so the stale ones form a prefix
+        start = int(np.searchsorted(timestamps, cutoff_ms, side='right'))
+        for _ in range(start):
+            self._timestamps.popleft()
+            self._total -= self._volumes.popleft()
+        self._arrays = (timestamps[start:], volumes[start:])
+    
+    @property
+    def latest_timestamp(self) -> int:
+        """Most recent sample time in milliseconds since the epoch."""
+        return self._timestamps[-1]
+    
+    def average_before_latest(self) -> float:
+        """
+        Average volume of all samples except the most recent one, in O(1).
+        
+        Returns:
+            Average volume (requires at least 2 samples)
+        """
+        return (self._total - self._volumes[-1]) / (len(self._volumes) - 1)
+    
+    def to_dict(self) -> Dict:
+        """
+        Serialize the series; arrays are encoded by orjson's NumPy support.
+        
+        Returns:
+            Dictionary with 'timestamps' and 'volumes' arrays
+        """
+        timestamps, volumes = self._as_arrays()
+        return {'timestamps': timestamps, 'volumes': volumes}
+    
+    def latest(self) -> Dict:
+        """
+        Get the most recent sample as a timestamped record.
+        
+        Returns:
+            {'timestamp': iso, 'volume': float} dictionary
+        """
+        return {
+            'timestamp': datetime.fromtimestamp(self._timestamps[-1] / MS_PER_SECOND).isoformat(),
+            'volume': self._volumes[-1]
+        }
+    
+    def records(self) -> List[Dict]:
+        """
+        Expand the series into timestamped records.
+        
+        Returns:
+            List of {'timestamp': iso, 'volume': float} dictionaries, oldest first
+        """
+        return [
+            {'timestamp': datetime.fromtimestamp(ts / MS_PER_SECOND).isoformat(), 'volume': volume}
+            for ts, volume in zip(self._timestamps, self._volumes)
+        ]
+
 
 class BybitVolumeScanner:
     """Scanner for detecting volume spikes on Bybit cryptocurrency pairs."""
@@ -20,7 +251,7 @@ class BybitVolumeScanner:
                  timeframe_hours: int = 24,
                  volume_increase_threshold: float = 30.0,
                  check_interval_seconds: int = 300,
-                 data_file: str = "volume_data.json"):
+                 data_file: str = "volume_data.zst"):
         """
         Initialize the Bybit Volume Scanner.
         
@@ -29,7 +260,7 @@ class BybitVolumeScanner:
             timeframe_hours: Lookback period in hours to calculate average volume
             volume_increase_threshold: Minimum % increase to trigger alert
             check_interval_seconds: Time between scans in seconds
-            data_file: Path to JSON file for storing volume history
+            data_file: Path to the zstd-compressed JSON snapshot of the volume history
         """
         self.session = HTTP(testnet=False)
         self.category = category
@@ -37,60 +268,356 @@ class BybitVolumeScanner:
         self.volume_increase_threshold = volume_increase_threshold
         self.check_interval_seconds = check_interval_seconds
         self.data_file = Path(data_file)
+        self.journal_file = self.data_file.with_suffix('.log')
+        # Serializes scans with config changes and resets coming from other threads
+        self._state_lock = threading.RLock()
         self.volume_history = self._load_volume_history()
         self.first_run = len(self.volume_history) == 0
+        
+        # Append-only journal of samples recorded since the last snapshot, opened on
+        # first write; after a write error it is unused until the next snapshot
+        self._journal: Optional[BinaryIO] = None
+        self._journal_failed = False
+        self._journal_symbol_ids: Dict[str, int] = {}
+        self._scans_since_compaction = 0
+        self._scans_since_prune = 0
+        if self.journal_file.exists() and self.journal_file.stat().st_size:
+            # Fold replayed entries into a fresh snapshot so symbol ids start over
+            self._save_volume_history()
+        
+        # Per-symbol summary served to the web UI, rebuilt once per scan and
+        # published atomically under the lock
+        self._lock = threading.Lock()
+        self._snapshot: List[Dict] = []
+        self._build_snapshot()
+        
+        # Background fetch of the next tickers snapshot (double buffering)
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self._next_tickers: Optional[Future] = None
+        self._next_tickers_started = 0.0
+    
+    @property
+    def history_window_seconds(self) -> int:
+        """Span of history kept per symbol: timeframe + 20% buffer for better calculation."""
+        return int(self.timeframe_hours * 1.2) * 3600
+    
+    @property
+    def max_samples(self) -> int:
+        """Number of scans that fit in the history window."""
+        return math.ceil(self.history_window_seconds / self.check_interval_seconds)
     
-    def _load_volume_history(self) -> Dict:
+    def update_history_limit(self):
         """
-        Load volume history from local JSON file.
+        Re-apply the per-symbol sample limit after timeframe or interval changes.
+        """
+        with self._state_lock:
+            for series in self.volume_history.values():
+                series.resize(self.max_samples)
+    
+    def configure(self, category: str, timeframe_hours: int,
+                  volume_increase_threshold: float, check_interval_seconds: int):
+        """
+        Update scanner settings; safe to call while another thread is scanning.
+        
+        Args:
+            category: Trading category ('spot', 'linear', 'inverse')
+            timeframe_hours: Lookback period in hours to calculate average volume
+            volume_increase_threshold: Minimum % increase to trigger alert
+            check_interval_seconds: Time between scans in seconds
+        """
+        with self._state_lock:
+            self.category = category
+            self.timeframe_hours = timeframe_hours
+            self.volume_increase_threshold = volume_increase_threshold
+            self.check_interval_seconds = check_interval_seconds
+            self.update_history_limit()
+    
+    def reset_history(self):
+        """
+        Drop all volume history and start over with a first-run baseline;
+        safe to call while another thread is scanning.
+        """
+        with self._state_lock:
+            self.volume_history = {}
+            self.first_run = True
+            self._save_volume_history()
+            self._build_snapshot()
+    
+    def _load_volume_history(self) -> Dict[str, VolumeSeries]:
+        """
+        Load volume history from the local (zstd-compressed) JSON snapshot and replay the journal on top.
         
         Returns:
             Dictionary mapping symbols to their volume history
         """
-        if self.data_file.exists():
+        volume_history = {}
+        
+        snapshot_file = self.data_file
+        legacy_file = self.data_file.with_suffix('.json')
+        if not snapshot_file.exists() and legacy_file.exists():
+            # Uncompressed volume_data.json written by older versions
+            snapshot_file = legacy_file
+        
+        if snapshot_file.exists():
             try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
+                with open(snapshot_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    raw = f.read()
+                if raw.startswith(ZSTD_MAGIC):
+                    raw = zstd.ZstdDecompressor().decompress(raw)
+                data = orjson.loads(raw)
+                volume_history = {
+                    symbol: (VolumeSeries.from_records(history, self.max_samples) if isinstance(history, list)
+                             else VolumeSeries.from_dict(history, self.max_samples))
+                    for symbol, history in data.items()
+                }
             except Exception as e:
                 print(f"Warning: Could not load volume history: {e}")
-                return {}
-        return {}
+                volume_history = {}
+        
+        if self.journal_file.exists():
+            try:
+                self._replay_journal(volume_history)
+            except Exception as e:
+                print(f"Warning: Could not replay volume journal: {e}")
+        
+        # Drop records that went stale while the scanner was not running
+        self._prune_stale_history(volume_history)
+        return volume_history
+    
+    def _prune_stale_history(self, volume_history: Dict[str, VolumeSeries]):
+        """
+        Drop records older than the history window in one pass over all symbols,
+        removing symbols left without any record (e.g. delisted pairs).
+        
+        Args:
+            volume_history: Volume history to prune, updated in place
+        """
+        cutoff_ms = int((time.time() - self.history_window_seconds) * MS_PER_SECOND)
+        for symbol, series in list(volume_history.items()):
+            series.prune(cutoff_ms)
+            if not series:
+                del volume_history[symbol]
+    
+    def _replay_journal(self, volume_history: Dict[str, VolumeSeries]):
+        """
+        Apply journal entries recorded since the last snapshot.
+        A truncated trailing entry (e.g. after a crash) ends the replay.
+        
+        Args:
+            volume_history: Volume history loaded from the snapshot, updated in place
+        """
+        with open(self.journal_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            data = f.read()
+        
+        symbols: Dict[int, str] = {}
+        offset = 0
+        while offset < len(data):
+            tag = data[offset]
+            
+            if tag == JOURNAL_TAG_SYMBOL and offset + JOURNAL_SYMBOL.size <= len(data):
+                _, symbol_id, length = JOURNAL_SYMBOL.unpack_from(data, offset)
+                offset += JOURNAL_SYMBOL.size
+                if offset + length > len(data):
+                    break
+                symbols[symbol_id] = data[offset:offset + length].decode()
+                offset += length
+            
+            elif tag == JOURNAL_TAG_SAMPLE and offset + JOURNAL_SAMPLE.size <= len(data):
+                _, symbol_id, volume, timestamp_ms = JOURNAL_SAMPLE.unpack_from(data, offset)
+                offset += JOURNAL_SAMPLE.size
+                symbol = symbols[symbol_id]
+                if symbol not in volume_history:
+                    volume_history[symbol] = VolumeSeries(maxlen=self.max_samples)
+                series = volume_history[symbol]
+                # Samples already in the snapshot (crash before truncation) are skipped
+                if not series or timestamp_ms > series.latest_timestamp:
+                    series.append(timestamp_ms, volume)
+            
+            else:
+                break
+    
+    def _journal_sample(self, symbol: str, volume: float, timestamp_ms: int):
+        """
+        Append a volume sample to the journal, defining the symbol on first use.
+        
+        Args:
+            symbol: Trading pair symbol
+            volume: Recorded 24h volume
+            timestamp_ms: Record time in milliseconds since the epoch
+        """
+        if self._journal_failed:
+            return
+        
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'ab', buffering=IO_BUFFER_SIZE)
+            
+            symbol_id = self._journal_symbol_ids.get(symbol)
+            if symbol_id is None:
+                symbol_id = len(self._journal_symbol_ids)
+                self._journal_symbol_ids[symbol] = symbol_id
+                name = symbol.encode()
+                self._journal.write(JOURNAL_SYMBOL.pack(JOURNAL_TAG_SYMBOL, symbol_id, len(name)) + name)
+            self._journal.write(JOURNAL_SAMPLE.pack(JOURNAL_TAG_SAMPLE, symbol_id, volume, timestamp_ms))
+        except Exception as e:
+            print(f"Warning: Could not write volume journal: {e}")
+            self._close_journal()
+            self._journal_failed = True
+    
+    def _close_journal(self):
+        """
+        Close the journal file, ignoring errors flushing already-buffered entries.
+        """
+        if self._journal is not None:
+            try:
+                self._journal.close()
+            except Exception:
+                pass
+            self._journal = None
+    
+    def _truncate_journal(self):
+        """
+        Empty the journal once everything in it is part of the snapshot.
+        """
+        self._close_journal()
+        self._journal_symbol_ids.clear()
+        self._scans_since_compaction = 0
+        try:
+            if self.journal_file.exists():
+                open(self.journal_file, 'wb').close()
+            self._journal_failed = False
+        except Exception as e:
+            # Stale entries would clash with new symbol ids, so keep journaling off
+            print(f"Warning: Could not write volume journal: {e}")
+            self._journal_failed = True
     
     def _save_volume_history(self):
         """
-        Save volume history to local JSON file.
+        Save the full volume history to the local zstd-compressed JSON snapshot and truncate the journal.
         """
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.volume_history, f, indent=2)
+            data = {symbol: series.to_dict() for symbol, series in self.volume_history.items()}
+            # Write to a temporary file first so a crash never leaves a truncated file
+            tmp_file = self.data_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(
+                    orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+                ))
+            tmp_file.replace(self.data_file)
+            
+            # Everything journaled so far is now part of the snapshot
+            self._truncate_journal()
         except Exception as e:
             print(f"Warning: Could not save volume history: {e}")
     
-    def _update_volume_record(self, symbol: str, volume: float):
+    def _build_snapshot(self):
+        """
+        Rebuild the per-symbol summary of tracked pairs, sorted by current volume descending,
+        and publish it.
+        """
+        snapshot = []
+        for symbol, history in self.volume_history.items():
+            if history:
+                latest = history.latest()
+                snapshot.append({
+                    'symbol': symbol,
+                    'current_volume': latest['volume'],
+                    'avg_volume': self._get_average_volume_from_history(symbol),
+                    'last_update': latest['timestamp'],
+                    'data_points': len(history)
+                })
+        
+        snapshot.sort(key=lambda x: x['current_volume'], reverse=True)
+        
+        with self._lock:
+            self._snapshot = snapshot
+    
+    def get_symbols_snapshot(self) -> List[Dict]:
+        """
+        Get the per-symbol summary published by the last scan.
+        Safe to call from other threads; the returned list is never mutated.
+        
+        Returns:
+            List of symbol summaries sorted by current volume descending
+        """
+        with self._lock:
+            return self._snapshot
+    
+    def get_history_records(self, symbol: str) -> Optional[List[Dict]]:
+        """
+        Get the volume history of a symbol as timestamped records.
+        Safe to call from other threads; records are built on request, between scans.
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            List of {'timestamp': iso, 'volume': float} dictionaries, or None if not tracked
+        """
+        with self._state_lock:
+            series = self.volume_history.get(symbol)
+            return series.records() if series is not None else None
+    
+    def _persist_scan(self):
+        """
+        Persist the samples recorded by a scan: the journal is flushed every scan,
+        the full snapshot is only rewritten every JOURNAL_COMPACT_EVERY scans.
+        """
+        self._scans_since_compaction += 1
+        # A scan the journal could not record is persisted by a full snapshot instead
+        if self._journal_failed or self._scans_since_compaction >= JOURNAL_COMPACT_EVERY:
+            self._save_volume_history()
+            return
+        
+        if self._journal is None:
+            return
+        try:
+            self._journal.flush()
+        except Exception as e:
+            print(f"Warning: Could not write volume journal: {e}")
+            self._close_journal()
+            self._journal_failed = True
+            self._save_volume_history()
+    
+    def _update_volume_record(self, symbol: str, volume: float, now_ms: Optional[int] = None):
         """
         Update volume history for a symbol.
         
         Args:
             symbol: Trading pair symbol
             volume: Current 24h volume
+            now_ms: Record time in milliseconds since the epoch (defaults to now)
         """
-        timestamp = datetime.now().isoformat()
+        if now_ms is None:
+            now_ms = int(time.time() * MS_PER_SECOND)
         
         if symbol not in self.volume_history:
-            self.volume_history[symbol] = []
-        
-        # Add new record
-        self.volume_history[symbol].append({
-            'timestamp': timestamp,
-            'volume': volume
-        })
-        
-        # Keep only records within timeframe + 20% buffer for better calculation
-        cutoff_time = datetime.now() - timedelta(hours=int(self.timeframe_hours * 1.2))
-        self.volume_history[symbol] = [
-            record for record in self.volume_history[symbol]
-            if datetime.fromisoformat(record['timestamp']) > cutoff_time
-        ]
+            self.volume_history[symbol] = VolumeSeries(maxlen=self.max_samples)
+        
+        # Add new record; the bounded series evicts records older than the history window
+        self.volume_history[symbol].append(now_ms, volume)
+        self._journal_sample(symbol, volume, now_ms)
+    
+    def _bulk_ingest(self, symbols: Iterable[str], volumes: Iterable[float], now_ms: int):
+        """
+        Record one baseline sample for every pair at once, skipping the journal.
+        Used on the first run, which writes a full snapshot right after.
+        
+        Args:
+            symbols: Trading pair symbols
+            volumes: Current 24h volume of each pair
+            now_ms: Record time in milliseconds since the epoch
+        """
+        max_samples = self.max_samples
+        for symbol, volume in zip(symbols, volumes):
+            # Skip if volume is negligible
+            if volume < MIN_VOLUME:
+                continue
+            series = self.volume_history.get(symbol)
+            if series is None:
+                self.volume_history[symbol] = VolumeSeries((now_ms,), (volume,), max_samples)
+            else:
+                series.append(now_ms, volume)
     
     def _get_average_volume_from_history(self, symbol: str) -> Optional[float]:
         """
@@ -102,18 +629,12 @@ class BybitVolumeScanner:
         Returns:
             Average volume or None if insufficient data
         """
+        # Need at least 2 data points to calculate meaningful average
         if symbol not in self.volume_history or len(self.volume_history[symbol]) < 2:
             return None
         
-        # Calculate average from all stored records
-        volumes = [record['volume'] for record in self.volume_history[symbol]]
-        
-        # Need at least 2 data points to calculate meaningful average
-        if len(volumes) >= 2:
-            # Exclude the most recent reading to avoid comparing current with current
-            return sum(volumes[:-1]) / len(volumes[:-1])
-        
-        return None
+        # Exclude the most recent reading to avoid comparing current with current
+        return self.volume_history[symbol].average_before_latest()
         
     def get_all_tickers(self) -> List[Dict]:
         """
@@ -133,45 +654,139 @@ class BybitVolumeScanner:
             print(f"Exception while fetching tickers: {e}")
             return []
     
-    def get_historical_volume(self, symbol: str, hours: int) -> float:
+    def prefetch_tickers(self):
         """
-        Calculate average volume over the specified historical period.
+        Start fetching the next tickers snapshot in the background.
+        The next scan consumes it instead of fetching synchronously.
+        """
+        self._next_tickers = self._prefetch_executor.submit(self.get_all_tickers)
+        self._next_tickers_started = time.monotonic()
+    
+    def _take_tickers(self) -> List[Dict]:
+        """
+        Get the tickers for a scan, preferring a fresh prefetched snapshot.
+        
+        Returns:
+            List of ticker dictionaries containing symbol and volume data
+        """
+        prefetched, self._next_tickers = self._next_tickers, None
+        if prefetched is not None and time.monotonic() - self._next_tickers_started <= PREFETCH_MAX_AGE_SECONDS:
+            tickers = prefetched.result()
+            if tickers:
+                return tickers
+        return self.get_all_tickers()
+    
+    def wait_for_next_scan(self):
+        """
+        Sleep until the next scan, prefetching its tickers snapshot shortly before.
+        """
+        lead = min(PREFETCH_LEAD_SECONDS, self.check_interval_seconds)
+        time.sleep(self.check_interval_seconds - lead)
+        self.prefetch_tickers()
+        time.sleep(lead)
+    
+    def _parse_kline_volume(self, response: Dict) -> float:
+        """
+        Average the volume column of a kline response.
+        
+        Args:
+            response: Decoded JSON body of a /v5/market/kline request
+            
+        Returns:
+            Average volume over the returned klines, or 0 if data unavailable
+        """
+        if response['retCode'] == 0 and response['result']['list']:
+            klines = response['result']['list']
+            # kline format: [startTime, open, high, low, close, volume, turnover]
+            volumes = [float(kline[5]) for kline in klines if kline[5]]
+            
+            if volumes:
+                return sum(volumes) / len(volumes)
+        
+        return 0.0
+    
+    async def _fetch_kline(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                           symbol: str, hours: int) -> float:
+        """
+        Fetch hourly klines for a symbol and return their average volume.
         
         Args:
+            session: Shared aiohttp session
+            semaphore: Semaphore bounding the number of concurrent requests
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
             hours: Number of hours to look back
             
         Returns:
             Average volume over the period, or 0 if data unavailable
         """
+        # Calculate time range
+        end_time = int(time.time() * MS_PER_SECOND)
+        start_time = end_time - hours * 3600 * MS_PER_SECOND
+        
+        params = {
+            'category': self.category,
+            'symbol': symbol,
+            'interval': "60",  # 1 hour intervals
+            'start': start_time,
+            'end': end_time,
+            'limit': 1000
+        }
+        
         try:
-            # Calculate time range
-            end_time = int(time.time() * 1000)
-            start_time = int((time.time() - hours * 3600) * 1000)
+            async with semaphore:
+                async with session.get(f"{BYBIT_API_URL}/v5/market/kline", params=params) as response:
+                    data = await response.json()
+            return self._parse_kline_volume(data)
+        except Exception as e:
+            print(f"Exception while fetching historical volume for {symbol}: {e}")
+            return 0.0
+    
+    async def _fetch_historical_volumes(self, symbols: List[str], hours: int) -> Dict[str, float]:
+        """
+        Fetch average historical volume for several symbols concurrently.
+        
+        Args:
+            symbols: Trading pair symbols to fetch
+            hours: Number of hours to look back
             
-            # Get hourly klines for the period
-            response = self.session.get_kline(
-                category=self.category,
-                symbol=symbol,
-                interval="60",  # 1 hour intervals
-                start=start_time,
-                end=end_time,
-                limit=1000
+        Returns:
+            Dictionary mapping each symbol to its average volume
+        """
+        semaphore = asyncio.Semaphore(KLINE_CONCURRENCY)
+        async with aiohttp.ClientSession() as session:
+            volumes = await asyncio.gather(
+                *[self._fetch_kline(session, semaphore, symbol, hours) for symbol in symbols]
             )
+        return dict(zip(symbols, volumes))
+    
+    def get_historical_volumes(self, symbols: List[str], hours: int) -> Dict[str, float]:
+        """
+        Calculate average volume over the specified historical period for several symbols.
+        Requests are issued concurrently, at most KLINE_CONCURRENCY at a time.
+        
+        Args:
+            symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+            hours: Number of hours to look back
             
-            if response['retCode'] == 0 and response['result']['list']:
-                klines = response['result']['list']
-                # kline format: [startTime, open, high, low, close, volume, turnover]
-                volumes = [float(kline[5]) for kline in klines if kline[5]]
-                
-                if volumes:
-                    return sum(volumes) / len(volumes)
-            
-            return 0.0
+        Returns:
+            Dictionary mapping each symbol to its average volume (0 if data unavailable)
+        """
+        if not symbols:
+            return {}
+        return asyncio.run(self._fetch_historical_volumes(symbols, hours))
+    
+    def get_historical_volume(self, symbol: str, hours: int) -> float:
+        """
+        Calculate average volume over the specified historical period.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            hours: Number of hours to look back
             
-        except Exception as e:
-            print(f"Exception while fetching historical volume for {symbol}: {e}")
-            return 0.0
+        Returns:
+            Average volume over the period, or 0 if data unavailable
+        """
+        return self.get_historical_volumes([symbol], hours)[symbol]
     
     def calculate_volume_change(self, current_volume: float, avg_volume: float) -> float:
         """
@@ -188,71 +803,165 @@ class BybitVolumeScanner:
             return 0.0
         return ((current_volume - avg_volume) / avg_volume) * 100
     
+    def calculate_volume_changes(self, current_volumes: np.ndarray, avg_volumes: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of calculate_volume_change over many pairs at once.
+        
+        Args:
+            current_volumes: Current 24h volume per pair
+            avg_volumes: Historical average volume per pair
+            
+        Returns:
+            Percentage change per pair (0 where the average is 0)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            changes = (current_volumes - avg_volumes) / avg_volumes * 100
+        return np.where(avg_volumes == 0, 0.0, changes)
+    
     def scan_volume_spikes(self) -> List[Dict]:
         """
         Scan all trading pairs for volume spikes exceeding the threshold.
         
+        Returns:
+            List of dictionaries containing alert information for pairs with volume spikes
+        """
+        tickers = self._take_tickers()
+        
+        # Only the network fetch happens outside the state lock
+        with self._state_lock:
+            return self._scan_tickers(tickers)
+    
+    def _scan_tickers(self, tickers: List[Dict]) -> List[Dict]:
+        """
+        Record a tickers snapshot and detect volume spikes in it.
+        Must be called with the state lock held.
+        
+        Args:
+            tickers: List of ticker dictionaries containing symbol and volume data
+            
         Returns:
             List of dictionaries containing alert information for pairs with volume spikes
         """
         alerts = []
-        tickers = self.get_all_tickers()
         
-        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Scanning {len(tickers)} pairs...")
+        # Single clock read shared by every record and alert of this scan
+        now = datetime.now()
+        now_ms = int(now.timestamp() * MS_PER_SECOND)
+        now_iso = now.isoformat()
+        
+        print(f"\n[{now.strftime('%Y-%m-%d %H:%M:%S')}] Scanning {len(tickers)} pairs...")
         
         if self.first_run:
             print("First run detected - building baseline data, no alerts will be triggered.")
         
-        for ticker in tickers:
-            symbol = ticker['symbol']
-            current_volume_24h = float(ticker.get('volume24h', 0))
+        # Appends are bounded by the series length; time-based pruning (pairs that stopped
+        # trading, config changes) only needs to run every few scans
+        self._scans_since_prune += 1
+        if self._scans_since_prune >= PRUNE_EVERY_SCANS:
+            self._prune_stale_history(self.volume_history)
+            self._scans_since_prune = 0
+        
+        # Extract every field we need in a single pass, as aligned columns
+        extracted = [
+            (ticker['symbol'], float(ticker.get('volume24h') or 0),
+             ticker.get('lastPrice', 'N/A'), ticker.get('price24hPcnt', 'N/A'))
+            for ticker in tickers
+        ]
+        symbols, volumes, last_prices, price_changes = zip(*extracted) if extracted else ((), (), (), ())
+        
+        # First run: just collect baseline data in one bulk insert, no spike detection
+        if self.first_run:
+            self._bulk_ingest(symbols, volumes, now_ms)
+            self._save_volume_history()
+            self._build_snapshot()
+            self.first_run = False
+            print(f"Baseline data collected for {len(self.volume_history)} pairs.")
+            return alerts
+        
+        # Indices of pairs with enough local history to be compared, in scan order
+        comparable = []
+        
+        for i, symbol in enumerate(symbols):
+            current_volume_24h = volumes[i]
             
             # Skip if volume is negligible
-            if current_volume_24h < 0.01:
+            if current_volume_24h < MIN_VOLUME:
                 continue
             
             # Update volume record with current data
-            self._update_volume_record(symbol, current_volume_24h)
-            
-            # Skip alerts on first run - just collect data
-            if self.first_run:
-                continue
-            
-            # Try to get average from local history first
-            avg_volume = self._get_average_volume_from_history(symbol)
+            self._update_volume_record(symbol, current_volume_24h, now_ms)
             
-            # If no local history, fall back to API (slower but necessary for new pairs)
-            if avg_volume is None:
-                avg_volume = self.get_historical_volume(symbol, self.timeframe_hours)
-                if avg_volume == 0:
-                    continue
-            
-            # Calculate volume change
-            volume_change_pct = self.calculate_volume_change(current_volume_24h, avg_volume)
+            # Average from local snapshots only; new pairs are skipped until they
+            # have accumulated at least 2 snapshots
+            if len(self.volume_history[symbol]) >= 2:
+                comparable.append(i)
+        
+        if comparable:
+            current_volumes = np.asarray(volumes, dtype=np.float64)[comparable]
+            # Exclude the most recent reading to avoid comparing current with current
+            avg_volumes = np.fromiter(
+                (self.volume_history[symbols[i]].average_before_latest() for i in comparable),
+                dtype=np.float64, count=len(comparable)
+            )
+            volume_changes = self.calculate_volume_changes(current_volumes, avg_volumes)
             
-            # Check if threshold exceeded
-            if volume_change_pct >= self.volume_increase_threshold:
+            # Only the (few) pairs exceeding the threshold are handled in Python
+            for j in np.flatnonzero(volume_changes >= self.volume_increase_threshold):
+                i = comparable[j]
                 alert_info = {
-                    'symbol': symbol,
-                    'current_volume': current_volume_24h,
-                    'avg_volume': avg_volume,
-                    'volume_change_pct': volume_change_pct,
-                    'last_price': ticker.get('lastPrice', 'N/A'),
-                    'price_change_24h': ticker.get('price24hPcnt', 'N/A'),
-                    'timestamp': datetime.now().isoformat()
+                    'symbol': symbols[i],
+                    'current_volume': float(current_volumes[j]),
+                    'avg_volume': float(avg_volumes[j]),
+                    'volume_change_pct': float(volume_changes[j]),
+                    'last_price': last_prices[i],
+                    'price_change_24h': price_changes[i],
+                    'timestamp': now_iso
                 }
                 alerts.append(alert_info)
         
         # Save updated volume history
-        self._save_volume_history()
-        
-        # After first run, subsequent runs will check for spikes
-        if self.first_run:
-            self.first_run = False
-            print(f"Baseline data collected for {len(self.volume_history)} pairs.")
+        self._persist_scan()
+        self._build_snapshot()
         
         return alerts
     
+    def bootstrap_history(self) -> int:
+        """
+        Seed local history from API klines for pairs that have no snapshots yet.
+        This is the only place per-symbol kline requests are made; regular scans
+        rely purely on locally stored ticker snapshots.
+        
+        Returns:
+            Number of pairs that were seeded
+        """
+        tickers = self.get_all_tickers()
+        missing = [
+            ticker['symbol'] for ticker in tickers
+            if ticker['symbol'] not in self.volume_history
+            and float(ticker.get('volume24h') or 0) >= MIN_VOLUME
+        ]
+        
+        print(f"Bootstrapping history for {len(missing)} pairs...")
+        historical_volumes = self.get_historical_volumes(missing, self.timeframe_hours)
+        
+        now_ms = int(time.time() * MS_PER_SECOND)
+        seeded = 0
+        with self._state_lock:
+            for symbol, avg_volume in historical_volumes.items():
+                if avg_volume == 0:
+                    continue
+                # Klines are hourly, snapshots hold rolling 24h volume
+                self._update_volume_record(symbol, avg_volume * 24, now_ms)
+                seeded += 1
+            
+            self._save_volume_history()
+            self._build_snapshot()
+            if seeded:
+                self.first_run = False
+        print(f"Seeded baseline data for {seeded} pairs.")
+        
+        return seeded
+    
     def send_alert(self, alert: Dict):
         """
         Send alert for a volume spike. Currently prints to console.
@@ -261,17 +970,14 @@ class BybitVolumeScanner:
         Args:
             alert: Dictionary containing alert information
         """
-        print("\n" + "="*80)
-        print("🚨 VOLUME SPIKE ALERT 🚨")
-        print("="*80)
-        print(f"Symbol:           {alert['symbol']}")
-        print(f"Current Volume:   {alert['current_volume']:,.2f}")
-        print(f"Average Volume:   {alert['avg_volume']:,.2f}")
-        print(f"Volume Increase:  {alert['volume_change_pct']:.2f}%")
-        print(f"Current Price:    {alert['last_price']}")
-        print(f"Price Change 24h: {alert['price_change_24h']}")
-        print(f"Time:             {alert['timestamp']}")
-        print("="*80 + "\n")
+        fields = dict(
+            alert,
+            current_volume=f"{alert['current_volume']:,.2f}",
+            avg_volume=f"{alert['avg_volume']:,.2f}",
+            volume_change_pct=f"{alert['volume_change_pct']:.2f}"
+        )
+        # One write per alert keeps alerts from interleaving with other output
+        sys.stdout.write(ALERT_TEMPLATE.format_map(fields))
     
     def run(self):
         """
@@ -300,7 +1006,7 @@ class BybitVolumeScanner:
                     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] No volume spikes detected.")
                 
                 print(f"Waiting {self.check_interval_seconds} seconds until next scan...\n")
-                time.sleep(self.check_interval_seconds)
+                self.wait_for_next_scan()
                 
         except KeyboardInterrupt:
             print("\n\nScanner stopped by user.")
@@ -313,6 +1019,13 @@ def main():
     Main entry point with configurable parameters.
     Modify these values to customize the scanner behavior.
     """
+    parser = argparse.ArgumentParser(description="Bybit crypto volume scanner")
+    parser.add_argument(
+        'command', nargs='?', default='run', choices=['run', 'bootstrap'],
+        help="'run' scans continuously (default), 'bootstrap' seeds history for new pairs from API klines"
+    )
+    args = parser.parse_args()
+    
     # Configuration
     CATEGORY = "spot"  # Options: 'spot', 'linear' (perpetual futures), 'inverse'
     TIMEFRAME_HOURS = 24  # Lookback period for average volume calculation
@@ -327,7 +1040,10 @@ def main():
         check_interval_seconds=CHECK_INTERVAL_SECONDS
     )
     
-    scanner.run()
+    if args.command == 'bootstrap':
+        scanner.bootstrap_history()
+    else:
+        scanner.run()
 
 
 if __name__ == "__main__":
@@ -7,21 +7,37 @@ A Flask-based web UI for monitoring and configuring the volume scanner.
 import os
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
+import orjson
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import JSONProvider
+from waitress import serve
 from main import BybitVolumeScanner
 
 # Get data file path from environment or use default
-DEFAULT_DATA_FILE = os.environ.get('DATA_FILE', 'volume_data.json')
+DEFAULT_DATA_FILE = os.environ.get('DATA_FILE', 'volume_data.zst')
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider serializing responses with orjson (including NumPy values)."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Global scanner instance and state
 scanner = None
 scanner_thread = None
 scanner_running = False
-latest_alerts = []
+latest_alerts = deque(maxlen=50)
 scan_status = {
     'is_running': False,
     'last_scan_time': None,
@@ -40,16 +56,15 @@ def run_scanner_loop():
             scan_status['last_scan_time'] = datetime.now().isoformat()
             alerts = scanner.scan_volume_spikes()
             
-            # Update alerts (keep last 50)
+            # Update alerts (the deque keeps the last 50)
             for alert in alerts:
-                latest_alerts.insert(0, alert)
-            latest_alerts[:] = latest_alerts[:50]
+                latest_alerts.appendleft(alert)
             
             scan_status['alerts_count'] = len(latest_alerts)
             scan_status['first_run'] = scanner.first_run
             
-            # Wait for next scan
-            time.sleep(scanner.check_interval_seconds)
+            # Wait for next scan, prefetching its tickers in the background
+            scanner.wait_for_next_scan()
             
         except Exception as e:
             print(f"Error in scanner loop: {e}")
@@ -70,10 +85,12 @@ def config():
         
         # Update scanner configuration
         if scanner:
-            scanner.category = data.get('category', scanner.category)
-            scanner.timeframe_hours = int(data.get('timeframe_hours', scanner.timeframe_hours))
-            scanner.volume_increase_threshold = float(data.get('volume_increase_threshold', scanner.volume_increase_threshold))
-            scanner.check_interval_seconds = int(data.get('check_interval_seconds', scanner.check_interval_seconds))
+            scanner.configure(
+                category=data.get('category', scanner.category),
+                timeframe_hours=int(data.get('timeframe_hours', scanner.timeframe_hours)),
+                volume_increase_threshold=float(data.get('volume_increase_threshold', scanner.volume_increase_threshold)),
+                check_interval_seconds=int(data.get('check_interval_seconds', scanner.check_interval_seconds))
+            )
         
         return jsonify({'status': 'success', 'message': 'Configuration updated'})
     
@@ -146,17 +163,18 @@ def status():
 def alerts():
     """Get latest alerts."""
     return jsonify({
-        'alerts': latest_alerts,
+        'alerts': list(latest_alerts),
         'count': len(latest_alerts)
     })
 
 @app.route('/api/volume-history/<symbol>')
 def volume_history(symbol):
     """Get volume history for a specific symbol."""
-    if scanner and symbol in scanner.volume_history:
+    history = scanner.get_history_records(symbol) if scanner else None
+    if history is not None:
         return jsonify({
             'symbol': symbol,
-            'history': scanner.volume_history[symbol]
+            'history': history
         })
     return jsonify({'error': 'Symbol not found'}), 404
 
@@ -166,26 +184,12 @@ def all_symbols():
     if not scanner:
         return jsonify({'error': 'Scanner not initialized'}), 400
     
-    symbols_data = []
-    for symbol, history in scanner.volume_history.items():
-        if history:
-            latest = history[-1]
-            avg_volume = scanner._get_average_volume_from_history(symbol)
-            
-            symbols_data.append({
-                'symbol': symbol,
-                'current_volume': latest['volume'],
-                'avg_volume': avg_volume,
-                'last_update': latest['timestamp'],
-                'data_points': len(history)
-            })
-    
-    # Sort by current volume descending
-    symbols_data.sort(key=lambda x: x['current_volume'], reverse=True)
+    # Summary is computed once per scan by the scanner
+    snapshot = scanner.get_symbols_snapshot()
     
     return jsonify({
-        'symbols': symbols_data,
-        'total': len(symbols_data)
+        'symbols': snapshot,
+        'total': len(snapshot)
     })
 
 @app.route('/api/reset', methods=['POST'])
@@ -194,9 +198,7 @@ def reset_data():
     global scanner, latest_alerts
     
     if scanner:
-        scanner.volume_history = {}
-        scanner.first_run = True
-        scanner._save_volume_history()
+        scanner.reset_history()
         latest_alerts.clear()
         
         return jsonify({'status': 'success', 'message': 'Volume history reset'})
@@ -210,4 +212,5 @@ if __name__ == '__main__':
     print("Access the dashboard at: http://localhost:5000")
     print("="*80)
     
-    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
+    # Production WSGI server; the scanner keeps running in its own thread
+    serve(app, host='0.0.0.0', port=5000, threads=8)